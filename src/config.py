@@ -11,6 +11,7 @@ class Settings(BaseSettings):
     # Mistral API Settings
     mistral_api_key: str = ""
     mistral_model: str = "mistral-small-latest"
+    mistral_warmup: bool = False  # send a warmup request on startup
 
     # ChromaDB Settings
     chroma_persist_directory: str = "./chroma_db"
@@ -20,12 +21,18 @@ class Settings(BaseSettings):
     upload_dir: str = "./uploads"
     max_upload_size: int = 10 * 1024 * 1024  # 10 MB
 
+    # PDF Processing Settings
+    chunk_max_chars: int = 1000  # maximum characters per chunk
+
     # RAG Settings
     retrieval_top_k: int = 5
     concurrency: int = 10
+    query_cache_ttl: int = 300  # seconds
+    query_cache_size: int = 1024
 
     # Logfire
     logfire_token: str = ""
+    tracing_enabled: bool = False
 
 
 settings = Settings()
@@ -1,6 +1,10 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+
 from fastapi import Request
 
 from protocols import PDFProcessorProtocol, VectorStoreProtocol, RAGServiceProtocol
+from src.config import settings
 
 
 def get_pdf_processor(request: Request) -> PDFProcessorProtocol:
@@ -14,3 +18,21 @@ def get_vector_store(request: Request) -> VectorStoreProtocol:
 def get_rag_service(request: Request) -> RAGServiceProtocol:
     return request.app.state.rag_service
 
+
+def get_pdf_pool(request: Request) -> Executor:
+    return request.app.state.pdf_pool
+
+
+def create_pdf_pool() -> ProcessPoolExecutor:
+    # Spawn workers: forking after Chroma/onnxruntime threads start can deadlock
+    return ProcessPoolExecutor(
+        max_workers=settings.concurrency,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def replace_pdf_pool(request: Request, broken_pool: Executor) -> None:
+    # Concurrent uploads may all see the same broken pool; only swap it once
+    if request.app.state.pdf_pool is broken_pool:
+        request.app.state.pdf_pool = create_pdf_pool()
+        broken_pool.shutdown(wait=False)
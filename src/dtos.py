@@ -4,4 +4,4 @@ from dataclasses import dataclass
 @dataclass(frozen=True)
 class PDFResult:
     filename: str
-    sentences: list[str]
+    chunks: list[str]
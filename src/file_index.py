@@ -0,0 +1,98 @@
+import sqlite3
+from pathlib import Path
+
+from src.config import settings
+
+FILE_INDEX_NAME = "files.sqlite3"
+
+
+class FileIndex:
+    """Tracks stored filenames and their chunk counts in a SQLite side table."""
+
+    def __init__(self):
+        path = Path(settings.chroma_persist_directory) / FILE_INDEX_NAME
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "name TEXT PRIMARY KEY, chunk_count INTEGER NOT NULL)"
+            )
+
+    def add(self, name: str, chunk_count: int) -> None:
+        """
+        Record a file, keeping the largest chunk count seen for it.
+
+        Args:
+            name: Filename
+            chunk_count: Number of chunks stored for the file
+        """
+        self.add_many([(name, chunk_count)])
+
+    def add_many(self, files: list[tuple[str, int]]) -> None:
+        """
+        Record several files at once.
+
+        Args:
+            files: (filename, chunk_count) pairs
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO files (name, chunk_count) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "chunk_count = MAX(chunk_count, excluded.chunk_count)",
+                files,
+            )
+
+    def remove(self, name: str) -> None:
+        """
+        Forget a file.
+
+        Args:
+            name: Filename
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    def clear(self) -> None:
+        """Forget all files."""
+        with self.connection:
+            self.connection.execute("DELETE FROM files")
+
+    def is_empty(self) -> bool:
+        """
+        Check whether any files are recorded.
+
+        Returns:
+            True if the index has no rows
+        """
+        row = self.connection.execute("SELECT 1 FROM files LIMIT 1").fetchone()
+
+        return row is None
+
+    def chunk_count(self, name: str) -> int | None:
+        """
+        Get the recorded chunk count for a file.
+
+        Args:
+            name: Filename
+
+        Returns:
+            Number of chunks, or None if the file is not recorded
+        """
+        row = self.connection.execute(
+            "SELECT chunk_count FROM files WHERE name = ?", (name,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def names(self) -> list[str]:
+        """
+        Get all recorded filenames.
+
+        Returns:
+            Sorted list of filenames
+        """
+        rows = self.connection.execute("SELECT name FROM files ORDER BY name")
+
+        return [name for (name,) in rows]
@@ -1,8 +1,10 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from src.config import settings
+from src.dependencies import create_pdf_pool
 from src.pdf_processor import PDFProcessor
 from src.rag_service import RAGService
 from src.routes import router
@@ -23,17 +25,27 @@ async def lifespan(app: FastAPI):
     app.state.pdf_processor = PDFProcessor()
     app.state.vector_store = VectorStore()
     app.state.rag_service = RAGService(vector_store=app.state.vector_store)
+    app.state.pdf_pool = create_pdf_pool()
     print("Services initialized and stored in app.state")
 
+    if settings.mistral_warmup:
+        try:
+            await app.state.rag_service.warmup()
+            print("Mistral connection warmed up")
+        except Exception as e:
+            print(f"Mistral warmup failed: {str(e)}")
+
     yield
 
     print("Shutting down application...")
+    app.state.pdf_pool.shutdown()
 
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(router, prefix="/api", tags=["RAG"])
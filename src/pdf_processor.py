@@ -1,13 +1,22 @@
 import os
 import uuid
 import re
+import textwrap
+from collections.abc import Iterator
 from pathlib import Path
 
-from pypdf import PdfReader
+import pypdfium2 as pdfium
+from fastapi import UploadFile
 
 from dtos import PDFResult
 from src.config import settings
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Sentence boundary: terminal punctuation, a whitespace run (group 1), then an
+# uppercase letter. Only the whitespace span is used to slice the text.
+_SENT_BOUNDARY_RE = re.compile(r"[.!?](\s+)(?=[A-Z])")
+
 
 class PDFProcessor:
     def __init__(self):
@@ -20,8 +29,7 @@ class PDFProcessor:
         Args:
             directory_path: Path to the directory
         """
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)
+        Path(directory_path).mkdir(parents=True, exist_ok=True)
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
@@ -37,15 +45,22 @@ class PDFProcessor:
             Exception: If PDF cannot be read
         """
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-
-            return text.strip()
+            document = pdfium.PdfDocument(pdf_path)
+            parts = []
+
+            try:
+                for page in document:
+                    text_page = page.get_textpage()
+                    page_text = text_page.get_text_range()
+                    text_page.close()
+                    page.close()
+
+                    if page_text:
+                        parts.append(page_text)
+            finally:
+                document.close()
+
+            return "\n".join(parts).strip()
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
 
@@ -59,13 +74,80 @@ class PDFProcessor:
         Returns:
             List of sentences
         """
-        sentence_pattern = r"(?<=[.!?])\s+(?=[A-Z])"
-        sentences = re.split(sentence_pattern, text)
+        sentences = []
+        start = 0
+
+        for match in _SENT_BOUNDARY_RE.finditer(text):
+            sentence = text[start : match.start(1)].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end(1)
 
-        sentences = [s.strip() for s in sentences if s.strip()]
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
 
         return sentences
 
+    def _pack_sentences(self, sentences: list[str]) -> list[str]:
+        """
+        Greedily pack sentences into chunks of at most settings.chunk_max_chars
+        characters, carrying the last sentence of each chunk into the next
+        one as overlap when it still fits. Sentences longer than the limit
+        are split on whitespace first.
+
+        Args:
+            sentences: Sentences to pack
+
+        Returns:
+            List of chunks
+        """
+        max_chars = settings.chunk_max_chars
+        chunks = []
+        window = []
+        window_size = 0
+
+        for sentence in self._split_long_sentences(sentences, max_chars):
+            if window and window_size + 1 + len(sentence) > max_chars:
+                chunks.append(" ".join(window))
+                last = window[-1]
+                if len(window) > 1 and len(last) + 1 + len(sentence) <= max_chars:
+                    window = [last]
+                    window_size = len(last)
+                else:
+                    window = []
+                    window_size = 0
+
+            window_size += len(sentence) + (1 if window else 0)
+            window.append(sentence)
+
+        if window:
+            chunks.append(" ".join(window))
+
+        return chunks
+
+    def _split_long_sentences(
+        self, sentences: list[str], max_chars: int
+    ) -> Iterator[str]:
+        """
+        Yield sentences, splitting any longer than max_chars into pieces
+        that fit.
+
+        Args:
+            sentences: Sentences to check
+            max_chars: Maximum piece length
+
+        Yields:
+            Sentences or sentence pieces of at most max_chars characters
+        """
+        for sentence in sentences:
+            if len(sentence) <= max_chars:
+                yield sentence
+            else:
+                yield from textwrap.wrap(
+                    sentence, width=max_chars, break_on_hyphens=False
+                )
+
     def process_pdf(self, pdf_path: str, filename: str) -> PDFResult:
         """
         Process a PDF file: extract text and create chunks.
@@ -75,7 +157,7 @@ class PDFProcessor:
             filename: Original filename
 
         Returns:
-            PDFResult containing chunks, metadatas, and ids
+            PDFResult containing filename and chunks
         """
         text = self.extract_text_from_pdf(pdf_path)
 
@@ -83,31 +165,51 @@ class PDFProcessor:
             raise ValueError("No text could be extracted from the PDF")
 
         sentences = self._split_into_sentences(text)
+        chunks = self._pack_sentences(sentences)
 
-        return PDFResult(filename=filename, sentences=sentences)
+        return PDFResult(filename=filename, chunks=chunks)
 
-    def save_uploaded_file(self, file_content: bytes, filename: str) -> str:
+    async def save_uploaded_file(self, file: UploadFile) -> str:
         """
-        Save uploaded file to disk.
+        Stream an uploaded file to disk in fixed-size chunks.
 
         Args:
-            file_content: File content as bytes
-            filename: Original filename
+            file: Uploaded file
 
         Returns:
             Path to saved file
+
+        Raises:
+            ValueError: If the file exceeds settings.max_upload_size
         """
-        file_path = Path(settings.upload_dir) / filename
+        file_path = Path(settings.upload_dir) / file.filename
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
 
-        if file_path.exists():
+        try:
+            fd = os.open(file_path, flags, 0o644)
+        except FileExistsError:
             stem = file_path.stem
             suffix = file_path.suffix
             timestamp = uuid.uuid4().hex[:8]
             filename = f"{stem}_{timestamp}{suffix}"
             file_path = Path(settings.upload_dir) / filename
+            fd = os.open(file_path, flags, 0o644)
 
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        total_size = 0
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    total_size += len(chunk)
+                    if total_size > settings.max_upload_size:
+                        raise ValueError(
+                            f"File size exceeds maximum allowed size of {settings.max_upload_size / (1024 * 1024):.1f} MB"
+                        )
+                    f.write(chunk)
+        except BaseException:
+            # Don't leave a truncated upload behind (oversize, I/O error, disconnect)
+            file_path.unlink(missing_ok=True)
+            raise
 
         return str(file_path)
 
@@ -1,10 +1,12 @@
 from typing import Protocol, Any
 
+from fastapi import UploadFile
+
 from dtos import PDFResult
 
 
 class PDFProcessorProtocol(Protocol):
-    def save_uploaded_file(self, content: bytes, filename: str) -> str:
+    async def save_uploaded_file(self, file: UploadFile) -> str:
         pass
 
     def process_pdf(self, pdf_path: str, filename: str) -> PDFResult:
@@ -15,6 +17,8 @@ class PDFProcessorProtocol(Protocol):
 
 
 class VectorStoreProtocol(Protocol):
+    generation: int
+
     def add_documents(self, pdf_result: PDFResult) -> None:
         pass
 
@@ -1,3 +1,6 @@
+import asyncio
+import time
+from functools import lru_cache
 from typing import Any
 
 import logfire
@@ -9,47 +12,52 @@ from protocols import VectorStoreProtocol
 from schemas import RAGResponse
 from src.config import settings
 
+_SYSTEM_PROMPT = """You are a helpful AI assistant that answers questions based on the provided context.
+
+Your task is to:
+1. Carefully read and understand the context provided from the documents
+2. Answer the user's question based ONLY on the information in the context
+3. If the context doesn't contain enough information to answer the question, clearly state that
+4. Be concise but comprehensive in your answers
+5. Cite specific parts of the context when relevant
+6. If you're uncertain, express that uncertainty
+
+Remember: Only use information from the provided context. Do not use external knowledge."""
+
+
+@lru_cache(maxsize=1)
+def _get_model() -> MistralModel:
+    """
+    Get the shared Mistral model, creating it and its provider on first use.
+
+    Returns:
+        MistralModel bound to a MistralProvider
+    """
+    provider = MistralProvider(api_key=settings.mistral_api_key)
+
+    return MistralModel(model_name=settings.mistral_model, provider=provider)
+
 
 class RAGService:
     """Handles RAG operations using Pydantic AI and Mistral."""
 
     def __init__(self, vector_store: VectorStoreProtocol):
         self.vector_store = vector_store
+        self._qcache: dict[tuple[str, int, int], tuple[float, RAGResponse]] = {}
 
-        self.provider = MistralProvider(api_key=settings.mistral_api_key)
-        self.model = MistralModel(
-            model_name=settings.mistral_model, provider=self.provider
-        )
+        self.model = _get_model()
 
-        logfire.configure(token=settings.logfire_token)
-        logfire.instrument_pydantic_ai()
+        if settings.logfire_token and settings.tracing_enabled:
+            logfire.configure(token=settings.logfire_token)
+            logfire.instrument_pydantic_ai()
 
         self.agent = Agent(
             model=self.model,
             output_type=RAGResponse,
-            system_prompt=self._get_system_prompt(),
+            system_prompt=_SYSTEM_PROMPT,
             max_concurrency=settings.concurrency,
         )
 
-    def _get_system_prompt(self) -> str:
-        """
-        Get the system prompt for the RAG agent.
-
-        Returns:
-            System prompt string
-        """
-        return """You are a helpful AI assistant that answers questions based on the provided context.
-
-        Your task is to:
-        1. Carefully read and understand the context provided from the documents
-        2. Answer the user's question based ONLY on the information in the context
-        3. If the context doesn't contain enough information to answer the question, clearly state that
-        4. Be concise but comprehensive in your answers
-        5. Cite specific parts of the context when relevant
-        6. If you're uncertain, express that uncertainty
-        
-        Remember: Only use information from the provided context. Do not use external knowledge."""
-
     def _format_context(
         self, documents: list[str], metadatas: list[dict[str, Any]]
     ) -> str:
@@ -63,17 +71,11 @@ class RAGService:
         Returns:
             Formatted context string
         """
-        context_parts = []
-
-        for i, (doc, metadata) in enumerate(zip(documents, metadatas), 1):
-            filename = metadata.get("filename", "Unknown")
-            chunk_index = metadata.get("chunk_index", "?")
-
-            context_parts.append(
-                f"[Document {i} - Source: {filename}, Chunk: {chunk_index}]\n{doc}\n"
-            )
-
-        return "\n".join(context_parts)
+        return "\n".join(
+            f"[Document {i} - Source: {metadata.get('filename', 'Unknown')}, "
+            f"Chunk: {metadata.get('chunk_index', '?')}]\n{doc}\n"
+            for i, (doc, metadata) in enumerate(zip(documents, metadatas), 1)
+        )
 
     async def query(self, question: str, top_k: int = None) -> RAGResponse:
         """
@@ -86,8 +88,22 @@ class RAGService:
         Returns:
             RAGResponse containing answer and sources
         """
+        if top_k is None:
+            top_k = settings.retrieval_top_k
+
+        # Keyed on the store generation so answers never outlive the documents
+        cache_key = (question, top_k, self.vector_store.generation)
+        cached = self._qcache.get(cache_key)
+        if cached is not None:
+            expires_at, response = cached
+            if expires_at > time.monotonic():
+                return response
+            del self._qcache[cache_key]
+
         # Retrieve relevant documents
-        search_results = self.vector_store.search(question, top_k=top_k)
+        search_results = await asyncio.to_thread(
+            self.vector_store.search, question, top_k
+        )
 
         if not search_results["documents"] or not search_results["documents"][0]:
             return RAGResponse(
@@ -109,4 +125,31 @@ class RAGService:
 
         result = await self.agent.run(prompt)
 
+        self._cache_response(cache_key, result.output)
+
         return result.output
+
+    async def warmup(self) -> None:
+        """
+        Send a trivial request so the Mistral HTTP connection is already
+        established when the first real query arrives.
+        """
+        await self.agent.run("hi")
+
+    def _cache_response(
+        self, key: tuple[str, int, int], response: RAGResponse
+    ) -> None:
+        """
+        Store a response in the query cache, evicting the oldest entry when full.
+
+        Args:
+            key: (question, top_k, store generation) cache key
+            response: Response to cache
+        """
+        if settings.query_cache_size <= 0:
+            return
+
+        if len(self._qcache) >= settings.query_cache_size:
+            del self._qcache[next(iter(self._qcache))]
+
+        self._qcache[key] = (time.monotonic() + settings.query_cache_ttl, response)
@@ -1,19 +1,30 @@
+import asyncio
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Annotated, Dict
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 
 from protocols import PDFProcessorProtocol, RAGServiceProtocol, VectorStoreProtocol
 from schemas import QueryRequest, RAGResponse, StatsResponse, UploadResponse
 from src.config import settings
-from src.dependencies import get_pdf_processor, get_rag_service, get_vector_store
+from src.dependencies import (
+    get_pdf_pool,
+    get_pdf_processor,
+    get_rag_service,
+    get_vector_store,
+    replace_pdf_pool,
+)
 
 router = APIRouter()
 
 
 @router.post("/upload", response_model=UploadResponse)
 async def upload_pdf(
+    request: Request,
     pdf_processor: Annotated[PDFProcessorProtocol, Depends(get_pdf_processor)],
     vector_store: Annotated[VectorStoreProtocol, Depends(get_vector_store)],
+    pdf_pool: Annotated[Executor, Depends(get_pdf_pool)],
     file: Annotated[UploadFile, File(description="PDF file to upload")],
 ) -> UploadResponse:
     """
@@ -22,17 +33,31 @@ async def upload_pdf(
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    content = await file.read()
-    if len(content) > settings.max_upload_size:
+    try:
+        file_path = await pdf_processor.save_uploaded_file(file)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error saving PDF: {str(e)}")
+
+    try:
+        # The bound method is pickled into a worker process
+        loop = asyncio.get_running_loop()
+        pdf_result = await loop.run_in_executor(
+            pdf_pool, pdf_processor.process_pdf, file_path, file.filename
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. parser crash or OOM kill); the pool is unusable
+        replace_pdf_pool(request, pdf_pool)
+        pdf_processor.delete_file(file_path)
         raise HTTPException(
-            status_code=400,
-            detail=f"File size exceeds maximum allowed size of {settings.max_upload_size / (1024 * 1024):.1f} MB",
+            status_code=500,
+            detail="Error processing PDF: the PDF parser worker crashed",
         )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
 
     try:
-        file_path = pdf_processor.save_uploaded_file(content, file.filename)
-        pdf_result = pdf_processor.process_pdf(file_path, file.filename)
-
         vector_store.add_documents(pdf_result=pdf_result)
         total_docs = vector_store.count_documents()
 
@@ -1,10 +1,35 @@
-import os
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any
 import chromadb
 from chromadb.config import Settings as ChromaSettings
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
 from dtos import PDFResult
 from src.config import settings
+from src.file_index import FileIndex
+
+ADD_BATCH_SIZE = 512
+SEARCH_CACHE_SIZE = 1024
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn lists into tuples and dicts into read-only mappings."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Rebuild fresh lists and dicts from a value produced by _freeze."""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
 
 
 class VectorStore:
@@ -16,30 +41,67 @@ class VectorStore:
             settings=ChromaSettings(anonymized_telemetry=False, allow_reset=True),
         )
 
+        self.embedding_function = DefaultEmbeddingFunction()
         self.collection = self.client.get_or_create_collection(
             name=settings.chroma_collection_name,
+            embedding_function=self.embedding_function,
         )
 
+        self.file_index = FileIndex()
+
+        # Bumped on every mutation so callers can key caches on store contents
+        self.generation = 0
+        self._search_cached = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search)
+
+        if self.file_index.is_empty() and self.collection.count():
+            self._backfill_file_index()
+
     def _create_directory(self) -> None:
         """Create directory if it doesn't exist."""
-        os.makedirs(settings.chroma_persist_directory, exist_ok=True)
+        Path(settings.chroma_persist_directory).mkdir(parents=True, exist_ok=True)
 
     def add_documents(self, pdf_result: PDFResult) -> None:
         """
         Add documents to the vector store.
 
         Args:
-            pdf_result: PDFResult object containing filename, sentences
+            pdf_result: PDFResult object containing filename, chunks
         """
-        ids = []
-        metadatas = []
-        for i, sentence in enumerate(pdf_result.sentences):
-            ids.append(f"{pdf_result.filename}-{i}")
-            metadatas.append({"filename": pdf_result.filename, "chunk_index": i})
-
-        self.collection.add(
-            ids=ids, metadatas=metadatas, documents=pdf_result.sentences
-        )
+        filename = pdf_result.filename
+        chunks = pdf_result.chunks
+        count = len(chunks)
+
+        ids = self._chunk_ids(filename, count)
+        metadatas = [{"filename": filename, "chunk_index": i} for i in range(count)]
+
+        for start in range(0, count, ADD_BATCH_SIZE):
+            end = start + ADD_BATCH_SIZE
+            self.collection.add(
+                ids=ids[start:end],
+                metadatas=metadatas[start:end],
+                documents=chunks[start:end],
+            )
+
+        self.file_index.add(filename, count)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Mark cached search results as stale after the collection changes."""
+        self.generation += 1
+        self._search_cached.cache_clear()
+
+    def _chunk_ids(self, filename: str, count: int) -> list[str]:
+        """
+        Build the deterministic ids for a file's chunks.
+
+        Args:
+            filename: Name of the file
+            count: Number of chunks
+
+        Returns:
+            List of ids in chunk order
+        """
+        return [f"{filename}-{i}" for i in range(count)]
 
     def search(self, query: str, top_k: int = None) -> Dict[str, Any]:
         """
@@ -50,14 +112,41 @@ class VectorStore:
             top_k: Number of results to return (defaults to settings.retrieval_top_k)
 
         Returns:
-            Dictionary containing documents, metadatas, and distances
+            Dictionary containing documents and metadatas
         """
         if top_k is None:
             top_k = settings.retrieval_top_k
 
-        results = self.collection.query(n_results=top_k, query_texts=[query])
+        # Thaw into fresh containers so callers can't mutate the cached result
+        return _thaw(self._search_cached(query, top_k, self.generation))
 
-        return results
+    def _search(
+        self, query: str, top_k: int, generation: int
+    ) -> MappingProxyType:
+        """
+        Run a similarity query against the collection.
+
+        Wrapped per instance in an LRU cache keyed by (query, top_k,
+        generation). Searches run in worker threads, so a query that started
+        before a mutation may finish after the cache was cleared; keying on
+        the generation read up front keeps that result from ever being hit.
+
+        Args:
+            query: Search query text
+            top_k: Number of results to return
+            generation: Store generation at call time (cache key only)
+
+        Returns:
+            Query result deep-frozen by _freeze
+        """
+        query_embeddings = self.embedding_function([query])
+        results = self.collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k,
+            include=["documents", "metadatas"],
+        )
+
+        return _freeze(dict(results))
 
     def delete_by_filename(self, filename: str) -> None:
         """
@@ -66,13 +155,20 @@ class VectorStore:
         Args:
             filename: Name of the file to delete documents for
         """
-        # Get all documents with this filename
-        results = self.collection.get(
-            where={"filename": filename}, include=["metadatas"]
-        )
+        chunk_count = self.file_index.chunk_count(filename)
 
-        if results["ids"]:
-            self.collection.delete(ids=results["ids"])
+        if chunk_count is None:
+            # Not indexed: fall back to a metadata filter
+            results = self.collection.get(where={"filename": filename}, include=[])
+            ids = results["ids"]
+        else:
+            ids = self._chunk_ids(filename, chunk_count)
+
+        if ids:
+            self.collection.delete(ids=ids)
+            self._invalidate()
+
+        self.file_index.remove(filename)
 
     def get_all_filenames(self) -> List[str]:
         """
@@ -81,14 +177,20 @@ class VectorStore:
         Returns:
             List of unique filenames
         """
+        return self.file_index.names()
+
+    def _backfill_file_index(self) -> None:
+        """Populate the file index from stored metadata with a one-off scan."""
         all_docs = self.collection.get(include=["metadatas"])
-        filenames = set()
+        chunk_counts: dict[str, int] = {}
 
-        for metadata in all_docs.get("metadatas", []):
-            if "filename" in metadata:
-                filenames.add(metadata["filename"])
+        for metadata in all_docs.get("metadatas") or []:
+            if metadata and "filename" in metadata:
+                filename = metadata["filename"]
+                chunk_count = int(metadata.get("chunk_index", 0)) + 1
+                chunk_counts[filename] = max(chunk_counts.get(filename, 0), chunk_count)
 
-        return sorted(list(filenames))
+        self.file_index.add_many(list(chunk_counts.items()))
 
     def count_documents(self) -> int:
         """
@@ -104,4 +206,7 @@ class VectorStore:
         self.client.delete_collection(name=settings.chroma_collection_name)
         self.collection = self.client.get_or_create_collection(
             name=settings.chroma_collection_name,
+            embedding_function=self.embedding_function,
         )
+        self._invalidate()
+        self.file_index.clear()